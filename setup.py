@@ -30,6 +30,9 @@ setup(
         'marshmallow>=3',
         'marshmallow-jsonapi>=0.24.0',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+    },
     license='MIT License',
     url='https://github.com/vladmunteanu/starlette-jsonapi',
     classifiers=[
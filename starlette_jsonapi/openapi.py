@@ -26,10 +26,13 @@ Example:
         schema_dict = schemas.get_schema(app.routes)
 
 """
+import copy
 import functools
+import inspect
 import re
-from collections import OrderedDict
-from typing import List, Type, Union, Dict, Any
+import types
+from collections import defaultdict
+from typing import List, Type, Union, Dict, Any, Match, Optional, Pattern, Tuple
 
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin, OpenAPIConverter
@@ -45,7 +48,7 @@ from starlette.convertors import CONVERTOR_TYPES
 from starlette_jsonapi.constants import OPENAPI_INFO, CONTENT_TYPE_HEADER
 from starlette_jsonapi.fields import JSONAPIRelationship
 from starlette_jsonapi.schema import JSONAPISchema
-from starlette_jsonapi.utils import safe_merge, isinstance_or_subclass
+from starlette_jsonapi.utils import safe_merge, merge, isinstance_or_subclass
 
 
 SchemaType = Union[str, dict, JSONAPISchema, Type[JSONAPISchema]]
@@ -58,17 +61,61 @@ PATH_PARAMS_REGEX = '({{({}):({})}})'.format(
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _path_params_re(convertor_types: frozenset) -> Pattern:
+    """
+    Compiles the path parameters regex for the given convertor types,
+    such that convertors registered after import are also recognized.
+    """
+    return re.compile('({{({}):({})}})'.format(
+        '|'.join(EXPECTED_PATH_PARAMETERS), '|'.join(sorted(convertor_types))
+    ))
+
+
 class BaseExceptionSchema(Schema):
     pass
 
 
+# map of (exception name, status code) to the generated exception schema
+_EXC_SCHEMA_CACHE = {}  # type: Dict[Tuple[str, str], Any]
+
+# map of (schema class, HTTP method) to the generated request schema
+_REQUEST_SCHEMA_CACHE = {}  # type: Dict[Tuple[Any, str], Any]
+
+
+# map of starlette path convertor type to OpenAPI type, anything else is a string
+_OPENAPI_PARAM_TYPES = {
+    'int': 'integer',
+    'float': 'number',
+}  # type: Dict[str, str]
+
+
 def get_openapi_parameter_type(parameter_type: str) -> str:
-    if parameter_type == 'int':
-        return 'integer'
-    elif parameter_type == 'float':
-        return 'number'
-    else:
-        return 'string'
+    return _OPENAPI_PARAM_TYPES.get(parameter_type, 'string')
+
+
+def _unwrap_partial(partial: functools.partial) -> Tuple[functools.partial, Any]:
+    """ Unwraps nested partials, returning the innermost partial and the function it wraps. """
+    obj = partial  # type: Any
+    last_partial = partial
+    while isinstance(obj, functools.partial):
+        last_partial = obj
+        obj = obj.func
+    return last_partial, obj
+
+
+def _rewrite_path_param(match: Match, path_params: List[dict]) -> str:
+    """ Records the path parameter found by ``match`` and returns its OpenAPI path template. """
+    name, parameter_type = match.group(2), match.group(3)
+    path_params.append(
+        {
+            'name': name,
+            'in': 'path',
+            'required': True,
+            'schema': {'type': _OPENAPI_PARAM_TYPES.get(parameter_type, 'string')}
+        }
+    )
+    return '{' + name + '}'
 
 
 class JSONAPISchemaConverter(OpenAPIConverter):
@@ -77,51 +124,62 @@ class JSONAPISchemaConverter(OpenAPIConverter):
         self.add_attribute_function(self.relationship_field)
 
     def fields2jsonschema(self, fields, *, ordered=False, partial=None):
-        schema_list = [field.parent for field in fields.values()]
-        if schema_list:
-            if not isinstance_or_subclass(schema_list[0], JSONAPISchema):
-                return super().fields2jsonschema(fields, partial=partial)
+        # the schema of the first field decides the representation, without building a list of parents
+        if fields and not isinstance_or_subclass(next(iter(fields.values())).parent, JSONAPISchema):
+            return super().fields2jsonschema(fields, partial=partial)
         default_fields = [
             ('id', None),
             ('type', {'type': 'string'}),
         ]
+        # dicts preserve insertion order, so ``ordered`` needs no special handling
         jsonschema = {
             'type': 'object',
-            'properties': OrderedDict(default_fields) if ordered else dict(default_fields),
+            'properties': dict(default_fields),
         }  # type: dict
         properties = jsonschema['properties']
-        if schema_list:
-            properties['type']['enum'] = list({schema.Meta.type_ for schema in schema_list})
+        # fields usually share the same parent, so Meta.type_ is read once per distinct schema
+        distinct_parents = {}  # type: Dict[int, Any]
 
+        attributes_props = {}  # type: dict
+        relationships_props = {}  # type: dict
+        required_attrs = []  # type: List[str]
+        required_rels = []  # type: List[str]
         for field_name, field_obj in fields.items():
+            distinct_parents[id(field_obj.parent)] = field_obj.parent
             observed_field_name = field_obj.data_key or field_name
+            field_is_rel = isinstance(field_obj, JSONAPIRelationship)
             prop = self.field2property(field_obj)
             if observed_field_name == 'id':
                 properties[observed_field_name] = prop
-            elif isinstance(field_obj, JSONAPIRelationship):
-                properties.setdefault('relationships', {'type': 'object', 'properties': {}})
-                properties['relationships']['properties'][observed_field_name] = prop
+            elif field_is_rel:
+                relationships_props[observed_field_name] = prop
             else:
-                properties.setdefault('attributes', {'type': 'object', 'properties': {}})
-                properties['attributes']['properties'][observed_field_name] = prop
+                attributes_props[observed_field_name] = prop
             # TODO: support meta fields
 
             if field_obj.required:
                 if not partial or (
                     is_collection(partial) and field_name not in partial
                 ):
-                    if isinstance(field_obj, JSONAPIRelationship):
-                        properties['relationships'].setdefault('required', []).append(observed_field_name)
+                    if field_is_rel:
+                        required_rels.append(observed_field_name)
                     else:
-                        properties['attributes'].setdefault('required', []).append(observed_field_name)
+                        required_attrs.append(observed_field_name)
+
+        if distinct_parents:
+            properties['type']['enum'] = sorted({parent.Meta.type_ for parent in distinct_parents.values()})
 
         jsonschema['required'] = ['type']
-        if 'attributes' in properties and 'required' in properties['attributes']:
-            properties['attributes']['required'].sort()
-            jsonschema['required'].append('attributes')
-        if 'relationships' in properties and 'required' in properties['relationships']:
-            properties['relationships']['required'].sort()
-            jsonschema['required'].append('relationships')
+        if attributes_props:
+            properties['attributes'] = {'type': 'object', 'properties': attributes_props}
+            if required_attrs:
+                properties['attributes']['required'] = sorted(required_attrs)
+                jsonschema['required'].append('attributes')
+        if relationships_props:
+            properties['relationships'] = {'type': 'object', 'properties': relationships_props}
+            if required_rels:
+                properties['relationships']['required'] = sorted(required_rels)
+                jsonschema['required'].append('relationships')
 
         return jsonschema
 
@@ -168,6 +226,8 @@ class JSONAPISchemaGenerator(BaseSchemaGenerator):
 
     def __init__(self, spec: APISpec):
         self.spec = spec
+        # map of registered endpoints to the generated specification
+        self._spec_cache = {}  # type: Dict[tuple, dict]
 
     def get_endpoints(self, routes: List[BaseRoute]) -> List[EndpointInfo]:
         """ Extends the base implementation to handle coroutines wrapped in functools.partial. """
@@ -190,6 +250,10 @@ class JSONAPISchemaGenerator(BaseSchemaGenerator):
 
         Returns the OpenAPI specification for the given routes.
 
+        The specification is cached for the registered endpoints, and the same dict is returned
+        on subsequent calls, so it should not be mutated. Changes to handlers or OpenAPI information
+        after the first call require a new schema generator.
+
         :param routes: List of registered routes
         :return: dict representation of the OpenAPI specification
         """
@@ -197,78 +261,101 @@ class JSONAPISchemaGenerator(BaseSchemaGenerator):
         from starlette_jsonapi.resource import BaseRelationshipResource, BaseResource
 
         endpoints_info = self.get_endpoints(routes)
-
+        cache_key = tuple(
+            (endpoint.path, endpoint.http_method, id(endpoint.func)) for endpoint in endpoints_info
+        )
+        cached_spec = self._spec_cache.get(cache_key)
+        if cached_spec is not None:
+            return cached_spec
+
+        # group operations by path, such that path parameters are computed once per path
+        paths = defaultdict(list)  # type: Dict[str, List[tuple]]
+        # map of resource class to its tag
+        tags_cache = {}  # type: Dict[Any, str]
         for endpoint in endpoints_info:
             openapi_info = {}  # type: dict
             path_params = []
-            tags = None
-            # we expect endpoint.func to be handle_request, wrapped in a functools.partial
-            if isinstance(endpoint.func, functools.partial):
-                obj = endpoint.func
-                last_partial = obj
-                while isinstance(obj, functools.partial):
-                    last_partial = obj
-                    obj = obj.func  # type: ignore
-
-                # get resource class and handler
+            # endpoints registered by resources carry the resource class and handler name
+            handler_cls, handler_name = getattr(
+                endpoint.func, '_starlette_jsonapi_handler', (None, None)
+            )  # type: Any, Any
+            if handler_cls is None and isinstance(endpoint.func, functools.partial):
+                # otherwise, we expect endpoint.func to be handle_request, wrapped in a functools.partial
+                last_partial, obj = _unwrap_partial(endpoint.func)
                 handler_cls = getattr(obj, '__self__', None)
-                if handler_cls and issubclass(handler_cls, (BaseResource, BaseRelationshipResource)):
-                    handler = getattr(handler_cls, last_partial.args[0], None)
-                    # traverse the reversed MRO of handler_cls, compute openapi_info
-                    openapi_info = compute_base_openapi_info(handler_cls).get('handlers', {}).get(handler.__name__)
-                    openapi_info['responses'] = process_responses(openapi_info.get('responses', {}))
-
-                    # add tags based on resource class
-                    tags = []
-                    if issubclass(handler_cls, BaseResource):
-                        tags.append(handler_cls.register_as or handler_cls.type_)
-                    else:
-                        tags.append(handler_cls.parent_resource.register_as or handler_cls.parent_resource.type_)
-
-                    # compute schema for handler, merging openapi_info added by @with_openapi_info
-                    openapi_info = safe_merge(openapi_info, getattr(handler, OPENAPI_INFO, {}))
-                    if tags:
-                        openapi_info.update(tags=tags)
-                    if not openapi_info.pop('include_in_schema', True):
-                        continue
-
-                    path_params = openapi_info.get('parameters', [])
-
-            # add path parameters
-            new_path = endpoint.path
-            groups = re.findall(PATH_PARAMS_REGEX, endpoint.path)
-            if groups:
-                for group in groups:
-                    path_params.append(
-                        {
-                            'name': group[1],
-                            'in': 'path',
-                            'required': True,
-                            'schema': {'type': get_openapi_parameter_type(group[2])}
-                        }
-                    )
-                    # transform {<param_name>:<param_type>} into {<param_name>}
-                    new_path = new_path.replace(group[0], '{' + group[1] + '}')
-
-            self.spec.path(path=new_path, operations={endpoint.http_method: openapi_info}, parameters=path_params)
-
-        return self.spec.to_dict()
-
-
+                handler_name = last_partial.args[0]
+
+            # get resource class and handler
+            if handler_cls and issubclass(handler_cls, (BaseResource, BaseRelationshipResource)):
+                handler = getattr(handler_cls, handler_name, None)  # type: Any
+                # traverse the reversed MRO of handler_cls, compute openapi_info
+                handlers = compute_base_openapi_info(handler_cls).get('handlers')
+                base_info = (handlers.get(handler.__name__) if handlers else None) or {}
+                # the base information is cached, so it's copied once and then owned by this endpoint
+                openapi_info = copy.deepcopy(base_info)
+                openapi_info['responses'] = process_responses(openapi_info.get('responses', {}))
+
+                # add tags based on resource class, computed once for all the handlers of a resource
+                tag = tags_cache.get(handler_cls)
+                if tag is None:
+                    resource = handler_cls if issubclass(handler_cls, BaseResource) else handler_cls.parent_resource
+                    tag = tags_cache[handler_cls] = resource.register_as or resource.type_
+
+                # compute schema for handler, merging openapi_info added by @with_openapi_info
+                merge(openapi_info, getattr(handler, OPENAPI_INFO, {}))
+                openapi_info.update(tags=[tag])
+                if not openapi_info.pop('include_in_schema', True):
+                    continue
+
+                path_params = openapi_info.get('parameters', [])
+
+            paths[endpoint.path].append((endpoint.http_method, openapi_info, path_params))
+
+        path_params_re = _path_params_re(frozenset(CONVERTOR_TYPES))
+        for path, path_operations in paths.items():
+            # add path parameters, transforming {<param_name>:<param_type>} into {<param_name>}
+            template_params = []  # type: List[dict]
+            new_path = path_params_re.sub(lambda match: _rewrite_path_param(match, template_params), path)
+
+            operations = {}
+            parameters = []  # type: List[dict]
+            for http_method, openapi_info, path_params in path_operations:
+                path_params.extend(template_params)
+                operations[http_method] = openapi_info
+                if path_params:
+                    parameters = path_params
+
+            self.spec.path(path=new_path, operations=operations, parameters=parameters)
+
+        spec_dict = self._spec_cache[cache_key] = self.spec.to_dict()
+        return spec_dict
+
+
+@functools.lru_cache(maxsize=None)
 def compute_base_openapi_info(klass: Type[Any]) -> dict:
     """
     Computes OpenAPI information for a resource class, traversing the MRO
     to merge information from base classes.
 
+    The result is cached per class and shared between callers, so it should not be mutated.
+
     :param klass: a BaseResource or BaseRelationshipResource subclass
     :return: merged OpenAPI information
     """
     from starlette_jsonapi.resource import BaseResource, BaseRelationshipResource
+    base_infos = [
+        getattr(base_klass, OPENAPI_INFO, {})
+        for base_klass in reversed(klass.__mro__)
+        if issubclass(base_klass, (BaseResource, BaseRelationshipResource))
+    ]
+    base_infos = [base_info for base_info in base_infos if base_info]
+    if len(base_infos) <= 1:
+        return base_infos[0] if base_infos else {}
+
+    # merge everything into a single dict, copying each base class information only once
     openapi_info: dict = {}
-    for base_klass in reversed(klass.__mro__):
-        if issubclass(base_klass, (BaseResource, BaseRelationshipResource)):
-            base_openapi_info = getattr(base_klass, OPENAPI_INFO, {})
-            openapi_info = safe_merge(openapi_info, base_openapi_info)
+    for base_info in base_infos:
+        merge(openapi_info, copy.deepcopy(base_info))
     return openapi_info
 
 
@@ -280,38 +367,41 @@ def process_responses(responses: dict) -> dict:
     :param responses: Dictionary of HTTP status code -> response
     :return: OpenAPI dictionary of responses
     """
+    if not responses:
+        return {}
+
     computed_responses = {}
+    changed = False
     for response_code, response in responses.items():
         if isinstance(response, dict):
             computed_responses[response_code] = response
-        elif isinstance(response, str) or isinstance_or_subclass(response, JSONAPISchema):
-            computed_responses.setdefault(response_code, {})
-            computed_responses[response_code] = safe_merge(
-                computed_responses[response_code], response_for_schema(schema=response)  # type: ignore
-            )
-        elif isinstance_or_subclass(response, Exception):
-            computed_responses.setdefault(response_code, {})
-            computed_responses[response_code] = safe_merge(
-                computed_responses[response_code],
-                response_for_exception(exception=response, status_code=response_code),
-            )
-    return computed_responses
+            continue
+
+        changed = True
+        response_is_class = inspect.isclass(response)
+        if isinstance(response, (str, JSONAPISchema)) or (response_is_class and issubclass(response, JSONAPISchema)):
+            computed_responses[response_code] = response_for_schema(schema=response)
+        elif isinstance(response, Exception) or (response_is_class and issubclass(response, Exception)):
+            computed_responses[response_code] = response_for_exception(exception=response, status_code=response_code)
+
+    # responses already in their OpenAPI representation are returned as they are
+    return computed_responses if changed else responses
 
 
-def process_request_body(request_body: SchemaType, method: str):
+def process_request_body(request_body: Optional[SchemaType], method: str):
     """
     Convert a request body to it's OpenAPI representation, correcting
     the `id` attribute of the schema.
 
     :param request_body: A schema for the request body which will be marked as required.
+                         ``None`` is returned unchanged.
     :param method: The HTTP method, usually one of: 'patch', 'post'
     :return: The OpenAPI representation for the given schema
     """
-    if (
-        not isinstance(request_body, (str, dict))
-        and isinstance_or_subclass(request_body, JSONAPISchema)
-    ):
-        request_body = request_for_schema(schema=request_body, method=method)
+    if isinstance(request_body, (str, dict)):
+        return request_body
+    if request_body is not None and isinstance_or_subclass(request_body, JSONAPISchema):
+        return request_for_schema(schema=request_body, method=method)
     return request_body
 
 
@@ -366,10 +456,6 @@ def with_openapi_info(
     def update_openapi_info(func):
         nonlocal request_body
 
-        @functools.wraps(func)
-        def wrapper_openapi_info(*fargs, **fkwargs):
-            return func(*fargs, **fkwargs)
-
         new_info = {'include_in_schema': include_in_schema, 'responses': {}}  # type: dict
         new_info.update(kwargs)
 
@@ -382,16 +468,41 @@ def with_openapi_info(
         if request_body:
             new_info['requestBody'] = process_request_body(request_body=request_body, method=func.__name__)
 
-        openapi_info = getattr(func, OPENAPI_INFO, dict())
-        openapi_info = safe_merge(openapi_info, new_info)
-        setattr(wrapper_openapi_info, OPENAPI_INFO, openapi_info)
-        return wrapper_openapi_info
+        # only stacked decorators have information to merge with, which is copied to keep func unaltered
+        openapi_info = getattr(func, OPENAPI_INFO, None)
+        openapi_info = safe_merge(openapi_info, new_info) if openapi_info else new_info
+
+        if isinstance(func, types.FunctionType):
+            # a copy sharing the code of func, such that requests don't go through an additional call,
+            # without altering the information of func, which may be inherited from a base resource
+            decorated_func = types.FunctionType(
+                func.__code__, func.__globals__, func.__name__, func.__defaults__, func.__closure__,
+            )
+            decorated_func.__kwdefaults__ = func.__kwdefaults__
+            functools.update_wrapper(decorated_func, func)
+        else:
+            @functools.wraps(func)
+            def decorated_func(*fargs, **fkwargs):
+                return func(*fargs, **fkwargs)
+
+        setattr(decorated_func, OPENAPI_INFO, openapi_info)
+        return decorated_func
     return update_openapi_info
 
 
+def _content_wrapper(schema: Any, *, description: str = None, required: bool = False) -> dict:
+    """ Wraps ``schema`` in an OpenAPI request / response body with the json:api content type. """
+    wrapper = {'content': {CONTENT_TYPE_HEADER: {'schema': schema}}}  # type: Dict[str, Any]
+    if description is not None:
+        wrapper['description'] = description
+    if required:
+        wrapper['required'] = True
+    return wrapper
+
+
 def response_for_schema(schema: SchemaType) -> dict:
     """ Generates a response schema. """
-    return {'content': {CONTENT_TYPE_HEADER: {'schema': schema}}, 'description': 'Example response'}
+    return _content_wrapper(schema, description='Example response')
 
 
 def response_for_exception(
@@ -403,29 +514,26 @@ def response_for_exception(
     status_code = str(getattr(exception, 'status_code', status_code or 500))
     exc_name = exception.__class__.__name__ if isinstance(exception, Exception) else exception.__name__
 
-    schema_cls_name = f'{exc_name}-{status_code}'
-    detail_schema_cls_name = f'{schema_cls_name}-detail'
-    try:
-        schema_cls = class_registry.get_class(schema_cls_name)
-    except RegistryError:
-        detail_schema_cls = type(
-            detail_schema_cls_name, (BaseExceptionSchema,),
-            {'detail': ma_fields.String(validate=validate.OneOf([detail_message]))}
-        )
+    cache_key = (exc_name, status_code)
+    schema_cls = _EXC_SCHEMA_CACHE.get(cache_key)
+    if schema_cls is None:
+        schema_cls_name = f'{exc_name}-{status_code}'
+        detail_schema_cls_name = f'{schema_cls_name}-detail'
+        try:
+            schema_cls = class_registry.get_class(schema_cls_name)
+        except RegistryError:
+            detail_schema_cls = type(
+                detail_schema_cls_name, (BaseExceptionSchema,),
+                {'detail': ma_fields.String(validate=validate.OneOf([detail_message]))}
+            )
 
-        schema_cls = type(
-            schema_cls_name, (BaseExceptionSchema,),
-            {'errors': ma_fields.List(ma_fields.Nested(detail_schema_cls))}
-        )
+            schema_cls = type(
+                schema_cls_name, (BaseExceptionSchema,),
+                {'errors': ma_fields.List(ma_fields.Nested(detail_schema_cls))}
+            )
+        _EXC_SCHEMA_CACHE[cache_key] = schema_cls
 
-    return {
-        'content': {
-            CONTENT_TYPE_HEADER: {
-                'schema': schema_cls,
-            }
-        },
-        'description': 'Example error response'
-    }
+    return _content_wrapper(schema_cls, description='Example error response')
 
 
 def response_for_relationship(schema: Union[JSONAPISchema, Type[JSONAPISchema]], relationship_name: str) -> dict:
@@ -467,12 +575,10 @@ def response_for_relationship(schema: Union[JSONAPISchema, Type[JSONAPISchema]],
         rel_item_schema = {'type': 'array', 'items': rel_item_schema}
     else:
         rel_item_schema = rel_item_schema
-    return {
-        'content': {
-            CONTENT_TYPE_HEADER: {'schema': {'type': 'object', 'properties': {'data': rel_item_schema}}}
-        },
-        'description': 'Example relationship response',
-    }
+    return _content_wrapper(
+        {'type': 'object', 'properties': {'data': rel_item_schema}},
+        description='Example relationship response',
+    )
 
 
 def request_for_relationship(schema: Union[JSONAPISchema, Type[JSONAPISchema]], relationship_name: str) -> dict:
@@ -512,13 +618,11 @@ def request_for_relationship(schema: Union[JSONAPISchema, Type[JSONAPISchema]],
         rel_item_schema = {'type': 'array', 'items': rel_item_schema}
     else:
         rel_item_schema = rel_item_schema
-    return {
-        'content': {
-            CONTENT_TYPE_HEADER: {'schema': {'type': 'object', 'properties': {'data': rel_item_schema}}}
-        },
-        'description': 'Example relationship request',
-        'required': True,
-    }
+    return _content_wrapper(
+        {'type': 'object', 'properties': {'data': rel_item_schema}},
+        description='Example relationship request',
+        required=True,
+    )
 
 
 def request_for_schema(
@@ -531,17 +635,21 @@ def request_for_schema(
         if isinstance(schema, JSONAPISchema):
             schema_cls = schema.__class__
 
-        schema_cls_id_field = schema_cls.get_fields().get('id', None)
-        if method == 'patch' and schema_cls_id_field and schema_cls_id_field.dump_only:
-            id_field = ma_fields.String(dump_only=False)
-        else:
-            id_field = schema_cls_id_field
-        schema = type(
-            schema_cls.__name__ + '-' + method, (schema_cls,),
-            {
-                'id': id_field,
-                'OPTIONS_CLASS': SchemaOpts,
-            }
-        )
+        cache_key = (schema_cls, method)
+        request_schema = _REQUEST_SCHEMA_CACHE.get(cache_key)
+        if request_schema is None:
+            schema_cls_id_field = schema_cls.get_fields().get('id', None)
+            if method == 'patch' and schema_cls_id_field and schema_cls_id_field.dump_only:
+                id_field = ma_fields.String(dump_only=False)
+            else:
+                id_field = schema_cls_id_field
+            request_schema = _REQUEST_SCHEMA_CACHE[cache_key] = type(
+                schema_cls.__name__ + '-' + method, (schema_cls,),
+                {
+                    'id': id_field,
+                    'OPTIONS_CLASS': SchemaOpts,
+                }
+            )
+        schema = request_schema
 
-    return {'content': {CONTENT_TYPE_HEADER: {'schema': schema}}, 'required': True}
+    return _content_wrapper(schema, required=True)
@@ -25,7 +25,12 @@ class BasePagination:
         - :meth:`slice_data`
         - :meth:`process_query_params`
         - :meth:`generate_pagination_links`
+
+    Paginators are created for every request, so attributes are stored in slots.
+    Subclasses can declare their own ``__slots__`` to avoid an instance dictionary.
     """
+    __slots__ = ('data', 'request')
+
     def __init__(self, request: Request, data: Sequence, **kwargs):
         """ Constructs a paginator object with Starlette support. """
         #: Data before pagination
@@ -52,7 +57,7 @@ class BasePagination:
         """ Slice the queryset according to the pagination rules, and create pagination links """
         data = self.slice_data(params)
         links = self.generate_pagination_links(params)
-        return Pagination(data=data, links=links)
+        return Pagination(data, links)
 
     def generate_pagination_links(self, params: dict = None) -> Dict[str, Optional[str]]:
         """Create a dict of pagination helper links"""
@@ -86,6 +91,8 @@ class BasePageNumberPagination(BasePagination):
     #: Can override client configured values.
     max_page_size = 100
 
+    __slots__ = ('page_size', 'page_number')
+
     def __init__(self, *args, **kwargs):
         #: Processed page size, initially :attr:`default_page_size`
         self.page_size = self.default_page_size
@@ -95,18 +102,20 @@ class BasePageNumberPagination(BasePagination):
 
     def process_query_params(self):
         """ Process HTTP query parameters to set :attr:`page_number` and :attr:`page_size`. """
-        page_number = self.request.query_params.get(
+        query_params = self.request.query_params
+        page_number = query_params.get(
             self.page_number_param,
             self.default_page_number
         )
-        page_size = self.request.query_params.get(
+        page_size = query_params.get(
             self.page_size_param,
             self.default_page_size
         )
 
         # perform sanity checks for page size and number values
         page_size = int(page_size)
-        page_size = min(page_size, self.max_page_size)  # ensure max page size is not exceeded
+        if page_size > self.max_page_size:  # ensure max page size is not exceeded
+            page_size = self.max_page_size
 
         page_number = int(page_number)
         if page_number < 0:
@@ -151,6 +160,8 @@ class BaseOffsetPagination(BasePagination):
     #: Can override client configured values.
     max_page_size = 100
 
+    __slots__ = ('page_size', 'page_offset')
+
     def __init__(self, *args, **kwargs):
         #: Processed page size, initially :attr:`default_page_size`
         self.page_size = self.default_page_size
@@ -160,18 +171,20 @@ class BaseOffsetPagination(BasePagination):
 
     def process_query_params(self):
         """ Process HTTP query parameters to set :attr:`page_offset` and :attr:`page_size`. """
-        page_offset = self.request.query_params.get(
+        query_params = self.request.query_params
+        page_offset = query_params.get(
             self.page_offset_param,
             self.default_page_offset
         )
-        page_size = self.request.query_params.get(
+        page_size = query_params.get(
             self.page_size_param,
             self.default_page_size
         )
 
         # perform sanity checks for page size and offset
         page_size = int(page_size)
-        page_size = min(page_size, self.max_page_size)  # ensure max page size is not exceeded
+        if page_size > self.max_page_size:  # ensure max page size is not exceeded
+            page_size = self.max_page_size
 
         page_offset = int(page_offset)
         if page_offset < 0:
@@ -222,6 +235,8 @@ class BaseCursorPagination(BasePagination):
     #: Can override client configured values.
     max_page_size = 100
 
+    __slots__ = ('page_size', 'page_after', 'page_before')
+
     def __init__(self, *args, **kwargs):
         #: Processed page size, initially :attr:`default_page_size`
         self.page_size = self.default_page_size
@@ -233,20 +248,22 @@ class BaseCursorPagination(BasePagination):
 
     def process_query_params(self):
         """ Process HTTP query parameters to set :attr:`page_after`, :attr:`page_before` and :attr:`page_size`. """
-        page_size = self.request.query_params.get(
+        query_params = self.request.query_params
+        page_size = query_params.get(
             self.page_size_param,
             self.default_page_size
         )
         # perform sanity checks for page size values
         page_size = int(page_size)
-        page_size = min(page_size, self.max_page_size)  # ensure max page size is not exceeded
+        if page_size > self.max_page_size:  # ensure max page size is not exceeded
+            page_size = self.max_page_size
 
-        self.page_size = int(page_size)
-        self.page_after = self.request.query_params.get(
+        self.page_size = page_size
+        self.page_after = query_params.get(
             self.page_after_param,
             self.default_page_after
         )
-        self.page_before = self.request.query_params.get(
+        self.page_before = query_params.get(
             self.page_before_param,
             self.default_page_before
         )
@@ -1,6 +1,7 @@
+import asyncio
 import functools
 import logging
-from typing import Type, Any, List, Optional, Union, Sequence, Dict
+from typing import Type, Any, List, Optional, Union, Sequence, Dict, Set, Tuple, AbstractSet
 
 from marshmallow.exceptions import ValidationError
 from starlette.applications import Starlette
@@ -20,8 +21,34 @@ from starlette_jsonapi.utils import (
     parse_included_params, serialize_error, process_sparse_fields, parse_sparse_fields_params,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# HTTP methods whose requests must use the json:api content type
+_BODY_METHODS = frozenset(('POST', 'PATCH'))
+
+
+@functools.lru_cache(maxsize=128)
+def _request_body_schema(schema: Type[JSONAPISchema], app: Starlette) -> JSONAPISchema:
+    """
+    Returns a schema instance used to validate and load request bodies.
+    Loading resets the state kept on the instance, so it can be shared by all requests.
+    """
+    return schema(app=app)
+
+
+@functools.lru_cache(maxsize=128)
+def _relationship_field(schema: Type[JSONAPISchema], app: Starlette, relationship_name: str) -> Any:
+    """
+    Returns a declared field of a schema instance, bound to ``app`` so it can render links.
+    Relationship fields keep no state when (de)serializing ids, so they can be shared by all requests.
+    """
+    return schema(app=app).declared_fields.get(relationship_name)
+
 
 class _BaseResourceHandler:
     """
@@ -32,7 +59,17 @@ class _BaseResourceHandler:
     #: High level filter for HTTP requests.
     #: If you specify a smaller subset, any request with a method
     #: not listed here will result in a 405 error.
-    allowed_methods = {'GET', 'PATCH', 'POST', 'DELETE'}
+    allowed_methods: AbstractSet[str] = frozenset(('GET', 'PATCH', 'POST', 'DELETE'))
+
+    #: Maximum size of a request body, in bytes.
+    #: Larger bodies are rejected with a 413 error before being parsed.
+    #: By default, the body size is not limited.
+    max_body_size: Optional[int] = None
+
+    #: Whether request bodies should be parsed with ``orjson``, if it is installed.
+    #: Unlike the standard library ``json``, orjson parses integers wider than 64 bits as floats,
+    #: losing precision, so this is disabled by default.
+    parse_body_with_orjson: bool = False
 
     def __init__(self, request: Request, request_context: dict, *args, **kwargs) -> None:
         """
@@ -46,6 +83,9 @@ class _BaseResourceHandler:
         #: Instance attribute representing the context of the current HTTP request.
         #: Can be used to store additional information for the duration of a request.
         self.request_context: dict = request_context
+        # query parameters parsed on first use, shared by all serializations of the request
+        self._sparse_fields: Optional[Dict[str, List[str]]] = None
+        self._included_params: Optional[Set[str]] = None
 
     @classmethod
     async def before_request(cls, request: Request, request_context: dict) -> None:
@@ -101,8 +141,8 @@ class _BaseResourceHandler:
         :param meta: Optional dictionary with meta information. Overwrites any existing top level `meta` in ``data``.
         """
         if meta:
-            data = data.copy()
-            data.update(meta=meta)
+            # data may be reused by the caller, so meta is added to a shallow copy of its top level keys
+            data = {**data, 'meta': meta}
         return JSONAPIResponse(
             content=data,
             *args, **kwargs,
@@ -111,23 +151,25 @@ class _BaseResourceHandler:
     @classmethod
     async def handle_request(
         cls, handler_name: str, request: Request, request_context: dict = None,
-        extract_params: List[str] = None, *args, **kwargs
+        extract_params: Sequence[str] = None, *args, **kwargs
     ) -> Response:
         """
         Handles a request by calling the appropriate handler.
         Additional args and kwargs are passed to the handler method, which is usually one of:
         :meth:`get`, :meth:`patch`, :meth:`delete`, :meth:`get_many` or :meth:`post`.
         """
-        request_context = request_context or {}
-        extract_params = extract_params or []
-        for path_param in extract_params:
-            value = request.path_params.get(path_param)
-            kwargs.update({path_param: value})
-            request_context.update({path_param: value})
+        # the context given at registration is shared by all requests to the route, so it's copied
+        request_context = dict(request_context) if request_context else {}
+        if extract_params:
+            path_params = request.path_params
+            for path_param in extract_params:
+                kwargs[path_param] = request_context[path_param] = path_params.get(path_param)
 
-        # run before request hook
+        # run before request hook, the default hooks do nothing and are not awaited
+        before_request = cls.before_request
         try:
-            await cls.before_request(request=request, request_context=request_context)
+            if getattr(before_request, '__func__', None) is not _default_before_request:
+                await before_request(request=request, request_context=request_context)
         except Exception as before_request_exc:
             response: Response = await cls.handle_error(request, request_context, exc=before_request_exc)
         else:
@@ -142,13 +184,56 @@ class _BaseResourceHandler:
                 response = await cls.handle_error(request, request_context, exc=e)
 
             # run after request hook
+            after_request = cls.after_request
             try:
-                await cls.after_request(request=request, request_context=request_context, response=response)
+                if getattr(after_request, '__func__', None) is not _default_after_request:
+                    await after_request(request=request, request_context=request_context, response=response)
             except Exception as after_request_exc:
                 response = await cls.handle_error(request, request_context, exc=after_request_exc)
 
         return response
 
+    @classmethod
+    def _handler_endpoint(cls, handler_name: str, **kwargs) -> functools.partial:
+        """
+        Wraps :meth:`handle_request` for ``handler_name`` in a :class:`functools.partial`,
+        used as a route endpoint. The resource class and handler name are attached to the partial,
+        so the OpenAPI schema generator does not need to unwrap it.
+        """
+        endpoint = functools.partial(cls.handle_request, handler_name, **kwargs)
+        endpoint._starlette_jsonapi_handler = (cls, handler_name)  # type: ignore
+        return endpoint
+
+    def _validate_content_type(self) -> None:
+        """ Raises a 400 :exc:`JSONAPIException` if a request with a body does not use the json:api content type. """
+        if (
+            self.request.method in _BODY_METHODS
+            and self.request.headers.get('content-type') != CONTENT_TYPE_HEADER
+        ):
+            raise JSONAPIException(
+                status_code=400,
+                detail=f'Incorrect or missing Content-Type header, expected `{CONTENT_TYPE_HEADER}`.',
+            )
+
+    async def _read_json(self) -> Any:
+        """
+        Parses the request body as JSON, using ``orjson`` if :attr:`parse_body_with_orjson` is set.
+        Raises a 413 :exc:`JSONAPIException` if the body exceeds :attr:`max_body_size`.
+        """
+        if self.max_body_size is not None:
+            chunks = []
+            size = 0
+            async for chunk in self.request.stream():
+                size += len(chunk)
+                if size > self.max_body_size:
+                    raise JSONAPIException(status_code=413)
+                chunks.append(chunk)
+            # cached where Starlette keeps the body, such that handlers can read it again
+            self.request._body = b''.join(chunks)
+        if self.parse_body_with_orjson and orjson is not None:
+            return orjson.loads(await self.request.body())
+        return await self.request.json()
+
     def process_sparse_fields_request(self, serialized_data: dict, many: bool = False) -> dict:
         """
         Processes sparse fields requests by calling
@@ -159,12 +244,22 @@ class _BaseResourceHandler:
         :param serialized_data: The complete json:api dict representation.
         :param many: Whether ``serialized_data`` should be treated as a collection.
         """
+        sparse_fields = self._sparse_fields
+        if sparse_fields is None:
+            sparse_fields = self._sparse_fields = parse_sparse_fields_params(self.request)
+        if not sparse_fields:
+            return serialized_data
         return process_sparse_fields(
             serialized_data, many=many,
-            sparse_fields=parse_sparse_fields_params(self.request),
+            sparse_fields=sparse_fields,
         )
 
 
+# functions of the default hooks, which handle_request skips
+_default_before_request = _BaseResourceHandler.__dict__['before_request'].__func__
+_default_after_request = _BaseResourceHandler.__dict__['after_request'].__func__
+
+
 class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
     """A basic json:api resource implementation, data layer agnostic.
 
@@ -226,6 +321,12 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
     #: Pagination class, subclass of :class:`BasePagination`
     pagination_class: Optional[Type[BasePagination]] = None
 
+    #: Whether :meth:`include_relations` should run concurrently for the items of a collection,
+    #: when using the default :meth:`include_relations_many`.
+    #: Enable only if :meth:`include_relations` is safe to run concurrently,
+    #: for example if it doesn't share a database session between calls.
+    parallel_include: bool = False
+
     register_as: str = ''
     """
     Optional, by default this will equal :attr:`type_` and will be used as the :attr:`mount` name.
@@ -257,6 +358,10 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
     #: Used in :meth:`serialize_related`.
     _related: Dict[str, Type['BaseResource']]
 
+    #: Maps each related resource to its full route names, as ``(related_route, related_id_route)``.
+    #: Populated when routes are registered, used in :meth:`serialize_related`.
+    _related_route_names: Dict[str, Tuple[str, str]]
+
     openapi_info = {
         'handlers': {
             'get': {
@@ -357,17 +462,46 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
         """
         raise JSONAPIException(status_code=400)
 
+    async def include_relations_many(self, objs: Sequence, relations: List[str]) -> None:
+        """
+        Prepares a collection for compound documents, by calling :meth:`include_relations` for every object,
+        concurrently if :attr:`parallel_include` is set.
+
+        Subclasses can override this to fetch the relations of all objects at once, avoiding a query per object.
+
+        :param objs: a sequence of objects that was passed to :meth:`serialize` with ``many=True``
+        :param relations: list of relations, as described in :meth:`include_relations`
+        """
+        if self.parallel_include:
+            await asyncio.gather(*(self.include_relations(obj=obj, relations=relations) for obj in objs))
+        else:
+            for obj in objs:
+                await self.include_relations(obj=obj, relations=relations)
+
+    def _get_request_body_schema(self) -> JSONAPISchema:
+        """ Returns the :attr:`schema` instance shared by requests to validate and load bodies. """
+        return _request_body_schema(self.schema, self.request.app)  # type: ignore
+
     async def deserialize_body(self, partial=None) -> dict:
         """
         Deserializes the request body according to :attr:`schema`.
+        Unless :meth:`validate_body` is overridden, the body is validated while being loaded.
 
         :param partial: Can be set to ``True`` during PATCH requests, to ignore missing fields.
                         For more advanced uses, like a specific iterable of missing fields,
                         you should check the marshmallow documentation.
         :raises: :exc:`starlette_jsonapi.exceptions.JSONAPIException`
         """
-        raw_body = await self.validate_body(partial=partial)
-        deserialized_body = self.schema(app=self.request.app).load(raw_body, partial=partial)
+        schema = self._get_request_body_schema()
+        if type(self).validate_body is not BaseResource.validate_body:
+            raw_body = await self.validate_body(partial=partial)
+            return schema.load(raw_body, partial=partial)
+
+        body = await self._read_body()
+        try:
+            deserialized_body = schema.load(body, partial=partial)
+        except ValidationError as exc:
+            raise self._invalid_body_exception(exc.messages)
         return deserialized_body
 
     async def validate_body(self, partial=None) -> dict:
@@ -381,23 +515,28 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
                         you should check the marshmallow documentation.
         :raises: :exc:`starlette_jsonapi.exceptions.JSONAPIException`
         """
-        content_type = self.request.headers.get('content-type')
-        if self.request.method in ('POST', 'PATCH') and content_type != CONTENT_TYPE_HEADER:
-            raise JSONAPIException(
-                status_code=400,
-                detail=f'Incorrect or missing Content-Type header, expected `{CONTENT_TYPE_HEADER}`.',
-            )
+        body = await self._read_body()
+        errors = self._get_request_body_schema().validate(body, partial=partial)
+        if errors:
+            raise self._invalid_body_exception(errors)
+        return body
+
+    async def _read_body(self) -> Any:
+        """ Reads the request body as JSON, after checking the content type. """
+        self._validate_content_type()
         try:
-            body = await self.request.json()
+            return await self._read_json()
+        except JSONAPIException:
+            raise
         except Exception:
             logger.debug('Could not read request body.', exc_info=True)
             raise JSONAPIException(status_code=400, detail='Could not read request body as JSON.')
 
-        errors = self.schema(app=self.request.app).validate(body, partial=partial)
-        if errors:
-            logger.debug('Could not validate request body according to JSON:API spec: %s.', errors)
-            raise JSONAPIException(status_code=400, errors=errors.get('errors'))
-        return body
+    @staticmethod
+    def _invalid_body_exception(errors: Any) -> JSONAPIException:
+        """ Builds the 400 error raised for a request body that does not pass :attr:`schema` validation. """
+        logger.debug('Could not validate request body according to JSON:API spec: %s.', errors)
+        return JSONAPIException(status_code=400, errors=errors.get('errors'))
 
     async def serialize(
             self, data: Any,
@@ -447,12 +586,12 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
         relationship = self.request_context['relationship']
         parent_id = self.request_context['id']
         related_resource_cls = self.__class__._related[relationship]  # type: Type[BaseResource]
-        related_route = f'{self.mount.name}:{relationship}'
+        related_route, related_id_route = self.__class__._related_route_names[relationship]
         related_route_kwargs = {
             'id': parent_id,
         }
         if self.request_context.get('related_id'):
-            related_route += '-id'
+            related_route = related_id_route
             related_route_kwargs.update(related_id='<id>')
 
         related_schema = related_resource_cls.schema(
@@ -513,6 +652,13 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
                 if field.related_resource:
                     cls._related[fname] = field.related_resource_class
 
+        # route names are built once here, instead of on every related request
+        name = cls.register_as or cls.type_
+        cls._related_route_names = {
+            rel_name: (f'{name}:{rel_name}', f'{name}:{rel_name}-id')
+            for rel_name in cls._related
+        }
+
         # attach secondary related routes, example: /articles/1/author/1
         routes = []
         for rel_name, rel_class in cls._related.items():
@@ -521,11 +667,10 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
                 routes.append(
                     Route(
                         '/{{id:{}}}/{}/{{related_id:{}}}'.format(cls.id_mask, rel_name, rel_class.id_mask),
-                        functools.partial(
-                            cls.handle_request,
+                        cls._handler_endpoint(
                             'get_related',
                             relationship=rel_name,
-                            extract_params=['id', 'related_id'],
+                            extract_params=('id', 'related_id'),
                             request_context={'relationship': rel_name},
                         ),
                         methods=['GET'],
@@ -535,11 +680,10 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
             routes.append(
                 Route(
                     '/{{id:{}}}/{}'.format(cls.id_mask, rel_name),
-                    functools.partial(
-                        cls.handle_request,
+                    cls._handler_endpoint(
                         'get_related',
                         relationship=rel_name,
-                        extract_params=['id'],
+                        extract_params=('id',),
                         request_context={'relationship': rel_name},
                     ),
                     methods=['GET'],
@@ -551,32 +695,31 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
         routes += [
             Route(
                 '/{{id:{}}}'.format(cls.id_mask),
-                functools.partial(cls.handle_request, 'get', extract_params=['id']),
+                cls._handler_endpoint('get', extract_params=('id',)),
                 methods=['GET'], name='get',
             ),
             Route(
                 '/{{id:{}}}'.format(cls.id_mask),
-                functools.partial(cls.handle_request, 'patch', extract_params=['id']),
+                cls._handler_endpoint('patch', extract_params=('id',)),
                 methods=['PATCH'], name='patch',
             ),
             Route(
                 '/{{id:{}}}'.format(cls.id_mask),
-                functools.partial(cls.handle_request, 'delete', extract_params=['id']),
+                cls._handler_endpoint('delete', extract_params=('id',)),
                 methods=['DELETE'], name='delete',
             ),
             Route(
                 '/',
-                functools.partial(cls.handle_request, 'get_many'),
+                cls._handler_endpoint('get_many'),
                 methods=['GET'], name='get_many',
             ),
             Route(
                 '/',
-                functools.partial(cls.handle_request, 'post'),
+                cls._handler_endpoint('post'),
                 methods=['POST'], name='post',
             ),
         ]
 
-        name = cls.register_as or cls.type_
         cls.mount = Mount(
             name=name,
             path='{}/{}'.format(base_path.rstrip('/'), cls.type_),
@@ -587,16 +730,17 @@ class BaseResource(_BaseResourceHandler, metaclass=RegisteredResourceMeta):
 
     async def _prepare_included(self, data: Any, many: bool) -> Optional[List[str]]:
         """
-        Processes the ``include`` query parameter and calls :meth:`include_relations`
-        for every object in ``data``, to enable requests for compound documents.
+        Processes the ``include`` query parameter and calls :meth:`include_relations_many`
+        for collections or :meth:`include_relations` for single objects, to enable requests for compound documents.
         """
-        include_param = parse_included_params(self.request)
+        include_param = self._included_params
+        if include_param is None:
+            include_param = self._included_params = parse_included_params(self.request) or set()
         if not include_param:
             return None
         include_param_list = list(include_param)
         if many is True:
-            for item in data:
-                await self.include_relations(obj=item, relations=include_param_list)
+            await self.include_relations_many(objs=data, relations=include_param_list)
         else:
             await self.include_relations(obj=data, relations=include_param_list)
         return include_param_list
@@ -666,9 +810,8 @@ class BaseRelationshipResource(_BaseResourceHandler):
 
     def _get_relationship_field(self) -> JSONAPIRelationship:
         """ Returns the relationship field defined on the parent resource schema. """
-        schema = self.parent_resource.schema(app=self.request.app)
-        declared_fields = schema.declared_fields
-        relationship = declared_fields.get(self.relationship_name)
+        schema = self.parent_resource.schema
+        relationship = _relationship_field(schema, self.request.app, self.relationship_name)  # type: ignore
         if not relationship or not isinstance(relationship, JSONAPIRelationship):
             raise AttributeError(f'Parent schema does not define `{self.relationship_name}` relationship.')
         return relationship
@@ -688,14 +831,11 @@ class BaseRelationshipResource(_BaseResourceHandler):
         Raises JSONAPIException with a 400 status code if the payload does not pass
         json:api validation.
         """
-        content_type = self.request.headers.get('content-type')
-        if self.request.method in ('POST', 'PATCH') and content_type != CONTENT_TYPE_HEADER:
-            raise JSONAPIException(
-                status_code=400,
-                detail=f'Incorrect or missing Content-Type header, expected `{CONTENT_TYPE_HEADER}`.',
-            )
+        self._validate_content_type()
         try:
-            body = await self.request.json()
+            body = await self._read_json()
+        except JSONAPIException:
+            raise
         except Exception:
             logger.debug('Could not read request body.', exc_info=True)
             raise JSONAPIException(status_code=400, detail='Could not read request body.')
@@ -749,7 +889,7 @@ class BaseRelationshipResource(_BaseResourceHandler):
                         cls.parent_resource.id_mask,
                         cls.relationship_name
                     ),
-                    endpoint=functools.partial(cls.handle_request, method.lower(), extract_params=['parent_id']),
+                    endpoint=cls._handler_endpoint(method.lower(), extract_params=('parent_id',)),
                     methods=[method],
                 )
             )
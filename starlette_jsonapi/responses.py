@@ -2,11 +2,21 @@ from typing import Any
 
 from starlette.responses import JSONResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 class JSONAPIResponse(JSONResponse):
     """
     Base response class for json:api requests, sets `Content-Type: application/vnd.api+json`.
 
+    When `orjson <https://github.com/ijl/orjson>`_ is installed, it is used to render the content,
+    falling back to the standard library ``json`` for anything it cannot encode.
+    Note that orjson renders ``NaN`` and infinite floats as ``null``,
+    where the standard library ``json`` would raise an error.
+
     For detailed information, see `Starlette responses <https://www.starlette.io/responses/>`_.
     """
     media_type = 'application/vnd.api+json'
@@ -14,4 +24,9 @@ class JSONAPIResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
         if content is None:
             return b''
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
         return super().render(content)
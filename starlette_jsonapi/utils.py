@@ -1,5 +1,5 @@
 import copy
-from typing import Optional, Set, Dict, List, Union
+from typing import Optional, Set, Dict, List, Union, Collection
 
 from starlette.applications import Starlette
 from starlette.exceptions import HTTPException
@@ -87,7 +87,7 @@ def parse_sparse_fields_params(request: Request) -> Dict[str, List[str]]:
     return sparse_fields
 
 
-def filter_sparse_fields(item: dict, sparse_fields: List[str]) -> dict:
+def filter_sparse_fields(item: dict, sparse_fields: Collection[str]) -> dict:
     """
     Given a dictionary with the json:api representation of an item,
     drops any attributes or relationships that are not found in ``sparse_fields``
@@ -100,10 +100,9 @@ def filter_sparse_fields(item: dict, sparse_fields: List[str]) -> dict:
     # filter `attributes`
     item_attributes = new_item.get('attributes')
     if item_attributes:
-        new_attributes = item_attributes.copy()
-        for attr_name in item_attributes:
-            if attr_name not in sparse_fields:
-                new_attributes.pop(attr_name, None)
+        new_attributes = {
+            attr_name: value for attr_name, value in item_attributes.items() if attr_name in sparse_fields
+        }
         if new_attributes:
             new_item['attributes'] = new_attributes
         else:
@@ -111,10 +110,9 @@ def filter_sparse_fields(item: dict, sparse_fields: List[str]) -> dict:
     # filter `relationships`
     item_relationships = new_item.get('relationships')
     if item_relationships:
-        new_relationships = item_relationships.copy()
-        for rel_name in item_relationships:
-            if rel_name not in sparse_fields:
-                new_relationships.pop(rel_name, None)
+        new_relationships = {
+            rel_name: value for rel_name, value in item_relationships.items() if rel_name in sparse_fields
+        }
         if new_relationships:
             new_item['relationships'] = new_relationships
         else:
@@ -136,39 +134,34 @@ def process_sparse_fields(serialized_data: dict, many: bool = False, sparse_fiel
     if not sparse_fields or not serialized_data.get('data'):
         return serialized_data
 
+    # requested fields are looked up for every attribute and relationship of every item
+    fields_by_type = {type_: frozenset(fields) for type_, fields in sparse_fields.items()}
+
+    filtered = False
+
+    def filter_item(item: dict) -> dict:
+        nonlocal filtered
+        item_fields = fields_by_type.get(item['type'])
+        if item_fields is None:
+            return item
+        filtered = True
+        return filter_sparse_fields(item, item_fields)
+
+    # process sparse-fields for `data`, then `included`, in a single pass over each
     data = serialized_data['data']
-    new_data = [] if many else {}  # type: Union[List, dict]
+    new_data = [filter_item(item) for item in data] if many else filter_item(data)
 
     included = serialized_data.get('included', None)
-    new_included = []
-
-    # process sparse-fields for `data`
-    if many:
-        new_data = []
-        for item in data:
-            if item['type'] in sparse_fields:
-                new_data.append(filter_sparse_fields(item, sparse_fields[item['type']]))
-            else:
-                new_data.append(item)
-    else:
-        if data['type'] in sparse_fields:
-            new_data = filter_sparse_fields(data, sparse_fields[data['type']])
-        else:
-            new_data = data
+    new_included = [filter_item(item) for item in included] if included else None
 
-    # process sparse-fields for `included`
-    if included:
-        for item in included:
-            if item['type'] in sparse_fields:
-                new_included.append(filter_sparse_fields(item, sparse_fields[item['type']]))
-            else:
-                new_included.append(item)
+    # none of the items have requested fields, so the document is returned as is
+    if not filtered:
+        return serialized_data
 
     new_serialized_data = serialized_data.copy()
     new_serialized_data['data'] = new_data
     if new_included:
         new_serialized_data['included'] = new_included
-
     return new_serialized_data
 
 
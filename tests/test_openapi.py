@@ -1,3 +1,4 @@
+import functools
 from collections import OrderedDict
 from typing import Any, List, Union, Dict, Type
 
@@ -6,7 +7,9 @@ from apispec import APISpec
 from apispec.utils import validate_spec
 from marshmallow_jsonapi import fields
 from starlette.applications import Starlette
+from starlette.convertors import CONVERTOR_TYPES, StringConvertor, register_url_convertor
 from starlette.responses import Response
+from starlette.routing import Route
 
 from starlette_jsonapi.constants import CONTENT_TYPE_HEADER
 from starlette_jsonapi.exceptions import ResourceNotFound
@@ -16,7 +19,9 @@ from starlette_jsonapi.schema import JSONAPISchema
 from starlette_jsonapi.meta import registered_resources
 from starlette_jsonapi.openapi import (
     JSONAPISchemaGenerator, JSONAPIMarshmallowPlugin,
-    with_openapi_info, response_for_relationship, request_for_relationship,
+    with_openapi_info, response_for_relationship, request_for_relationship, request_for_schema,
+    compute_base_openapi_info, process_responses, get_openapi_parameter_type,
+    process_request_body,
 )
 
 
@@ -187,6 +192,50 @@ def test_routes_are_not_included(
             assert (method in schema['paths'][path]) is registered
 
 
+def test_schema_generation_is_repeatable(openapi_app: Starlette, openapi_schema_as_dict):
+    first_schema = openapi_schema_as_dict(openapi_app)
+    second_schema = openapi_schema_as_dict(openapi_app)
+    assert first_schema == second_schema
+    # the same generator returns the cached specification
+    assert getattr(openapi_app, 'schema_generator').get_schema(openapi_app.routes) is second_schema
+
+
+def test_compute_base_openapi_info():
+    assert compute_base_openapi_info(BaseResource) == BaseResource.openapi_info
+
+    class TResource(BaseResource):
+        openapi_info = {
+            'handlers': {
+                'get': {'description': 'Test description from class', 'tags': ['test']},
+            }
+        }
+
+    class TChildResource(TResource):
+        openapi_info = {
+            'handlers': {
+                'get': {'tags': ['child']},
+            }
+        }
+
+    openapi_info = compute_base_openapi_info(TChildResource)
+    assert openapi_info['handlers']['get']['description'] == 'Test description from class'
+    assert openapi_info['handlers']['get']['tags'] == ['test', 'child']
+    assert openapi_info['handlers']['patch'] == BaseResource.openapi_info['handlers']['patch']
+    assert TResource.openapi_info['handlers']['get']['tags'] == ['test']
+
+
+def test_process_responses():
+    assert process_responses({}) == {}
+
+    responses = {'200': {'description': 'OK'}}
+    assert process_responses(responses) is responses
+
+    computed_responses = process_responses({'200': {'description': 'OK'}, '404': ResourceNotFound, '409': 1})
+    assert computed_responses['200'] == {'description': 'OK'}
+    assert computed_responses['404']['description'] == 'Example error response'
+    assert '409' not in computed_responses
+
+
 def test_response_schema(openapi_app: Starlette, openapi_schema_as_dict):
     TChildResource = registered_resources['TChildResource']
     TChildResource.get = with_openapi_info(
@@ -332,6 +381,15 @@ def test_request_schema(openapi_app: Starlette, openapi_schema_as_dict):
     assert validate_spec(openapi_app.schema_generator.spec) is True
 
 
+def test_request_schema_is_reused(openapi_app: Starlette):
+    TParentResource = registered_resources['TParentResource']
+    first_request = request_for_schema(TParentResource.schema, method='patch')
+    second_request = request_for_schema(TParentResource.schema(), method='patch')
+    first_schema = first_request['content'][CONTENT_TYPE_HEADER]['schema']
+    assert first_schema is second_request['content'][CONTENT_TYPE_HEADER]['schema']
+    assert first_schema is not request_for_schema(TParentResource.schema)['content'][CONTENT_TYPE_HEADER]['schema']
+
+
 # test response for relationships
 def test_response_for_relationships(openapi_resources, openapi_app: Starlette, openapi_schema_as_dict):
     TChildResourceRel = openapi_resources['TChildResourceRel']
@@ -632,6 +690,35 @@ def test_openapi_info_parameters_for_endpoint(app: Starlette, openapi_schema_as_
     assert validate_spec(app.schema_generator.spec) is True
 
 
+def test_partial_endpoint_without_handler_info(app: Starlette, openapi_schema_as_dict):
+    class TResourceSchema(JSONAPISchema):
+        id = fields.String()
+        description = fields.String()
+
+        class Meta:
+            type_ = 'test'
+
+    class TResource(BaseResource):
+        schema = TResourceSchema
+        type_ = 'test'
+
+        @with_openapi_info(description='Test description for a manually registered route')
+        async def get(self, id: Any, *args, **kwargs) -> Response:
+            pass
+
+    app.routes.append(
+        Route(
+            '/manual/{id:str}',
+            functools.partial(functools.partial(TResource.handle_request, 'get'), extract_params=['id']),
+            methods=['GET'],
+        )
+    )
+    schema = openapi_schema_as_dict(app)
+    assert schema['paths']['/manual/{id}']['get']['description'] == 'Test description for a manually registered route'
+    assert schema['paths']['/manual/{id}']['get']['tags'] == ['test']
+    assert validate_spec(getattr(app, 'schema_generator').spec) is True
+
+
 def test_required_attributes_and_relationships(app: Starlette, openapi_schema_as_dict):
     class TResourceSchema(JSONAPISchema):
         id = fields.String()
@@ -723,6 +810,40 @@ def test_multiple_with_openapi_info(app: Starlette, openapi_schema_as_dict):
     assert validate_spec(app.schema_generator.spec) is True
 
 
+def test_with_openapi_info_does_not_alter_base_handlers(app: Starlette):
+    class TResourceSchema(JSONAPISchema):
+        id = fields.String()
+        description = fields.String()
+
+        class Meta:
+            type_ = 'test'
+
+    class TResource(BaseResource):
+        schema = TResourceSchema
+        type_ = 'test'
+
+        @with_openapi_info(summary='Test summary')
+        @with_openapi_info(description='Test description')
+        async def get(self, id: Any, *args, **kwargs) -> Response:
+            return Response(status_code=200)
+
+    setattr(TResource, 'patch', with_openapi_info(summary='Test summary')(TResource.patch))
+    assert TResource.patch is not BaseResource.patch
+    assert 'summary' not in BaseResource.patch.openapi_info
+    assert TResource.get.openapi_info['summary'] == 'Test summary'
+    assert TResource.get.openapi_info['description'] == 'Test description'
+    # handlers are not wrapped, the decorated function runs the original code
+    assert TResource.get.__code__ is TResource.get.__wrapped__.__code__
+
+    class CallableHandler:
+        def __call__(self, *args, **kwargs) -> str:
+            return 'called'
+
+    handler = with_openapi_info(summary='Test summary')(CallableHandler())
+    assert handler.openapi_info['summary'] == 'Test summary'
+    assert handler() == 'called'
+
+
 def test_request_for_relationships(openapi_resources, openapi_app: Starlette, openapi_schema_as_dict):
     TChildResourceRel = openapi_resources['TChildResourceRel']
     TChildResourceRel.patch = with_openapi_info(
@@ -849,3 +970,51 @@ def test_request_for_relationships_invalid_field(app: Starlette):
 
     with pytest.raises(KeyError):
         request_for_relationship(TResourceSchema, 'unknown')
+
+
+def test_get_openapi_parameter_type():
+    assert get_openapi_parameter_type('int') == 'integer'
+    assert get_openapi_parameter_type('float') == 'number'
+    assert get_openapi_parameter_type('str') == 'string'
+    assert get_openapi_parameter_type('path') == 'string'
+
+
+def test_process_request_body():
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+
+        class Meta:
+            type_ = 'test-resource'
+
+    assert process_request_body('test-resource', 'post') == 'test-resource'
+    body: dict = {'content': {}}
+    assert process_request_body(body, 'post') is body
+    assert process_request_body(None, 'post') is None
+    assert process_request_body(TSchema, 'post') == request_for_schema(TSchema, 'post')
+
+
+def test_path_parameters_custom_convertor(app: Starlette, openapi_schema_as_dict):
+    class SlugConvertor(StringConvertor):
+        regex = '[a-z0-9-]+'
+
+    register_url_convertor('test-slug', SlugConvertor())
+    try:
+        class TResourceSchema(JSONAPISchema):
+            id = fields.String()
+
+            class Meta:
+                type_ = 'test-slug'
+
+        class TResource(BaseResource):
+            schema = TResourceSchema
+            type_ = 'test-slug'
+            id_mask = 'test-slug'
+
+        TResource.register_routes(app)
+
+        schema = openapi_schema_as_dict(app)
+        assert schema['paths']['/test-slug/{id}']['parameters'] == [
+            {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}
+        ]
+    finally:
+        CONVERTOR_TYPES.pop('test-slug')
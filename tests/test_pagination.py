@@ -49,6 +49,18 @@ def test_unimplemented_generate_pagination_links():
     assert links == {}
 
 
+def test_slotted_pagination_subclass():
+    class TPagination(BasePageNumberPagination):
+        __slots__ = ()
+
+    request = MagicMock()
+    request.query_params = {}
+    paginator = TPagination(request=request, data=[])
+    assert not hasattr(paginator, '__dict__')
+    assert paginator.page_number == 1
+    assert paginator.page_size == 50
+
+
 def test_base_page_number_pagination_process_query_params():
     # test initialization on specified values
     request = MagicMock()
@@ -73,6 +85,13 @@ def test_base_page_number_pagination_process_query_params():
 
     assert paginator.page_number == paginator.default_page_number
 
+    # test page size is capped to the maximum
+    request = MagicMock()
+    request.query_params = {'page[size]': 1000}
+    paginator = BasePageNumberPagination(request=request, data=[])
+
+    assert paginator.page_size == paginator.max_page_size
+
 
 def test_base_page_number_pagination_create_pagination_link():
     url = URL('http://testserver/test-resource')
@@ -108,6 +127,13 @@ def test_base_offset_pagination_process_query_params():
 
     assert paginator.page_offset == paginator.default_page_offset
 
+    # test page size is capped to the maximum
+    request = MagicMock()
+    request.query_params = {'page[size]': 1000}
+    paginator = BaseOffsetPagination(request=request, data=[])
+
+    assert paginator.page_size == paginator.max_page_size
+
 
 def test_base_offset_pagination_create_pagination_link():
     url = URL('http://testserver/test-resource')
@@ -138,6 +164,13 @@ def test_base_cursor_pagination_process_query_params():
     assert paginator.page_after == paginator.default_page_after
     assert paginator.page_size == paginator.default_page_size
 
+    # test page size is capped to the maximum
+    request = MagicMock()
+    request.query_params = {'page[size]': 1000}
+    paginator = BaseCursorPagination(request=request, data=[])
+
+    assert paginator.page_size == paginator.max_page_size
+
 
 def test_base_cursor_pagination_create_pagination_link():
     url = URL('http://testserver/test-resource')
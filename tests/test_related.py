@@ -1,6 +1,7 @@
 import json
 import logging
 from asyncio import Future
+from http import HTTPStatus
 from typing import Any
 from unittest import mock
 
@@ -470,6 +471,57 @@ def test_handle_error_logs_unhandled_exceptions_in_relationship_resource(app: St
     assert any(log.exc_info[1] == exc and log.name == 'starlette_jsonapi.resource' for log in caplog.records)
 
 
+def test_relationship_resource_max_body_size(app: Starlette):
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+
+        rel = JSONAPIRelationship(
+            schema='TRelatedSchema',
+            type_='test-related-resource',
+        )
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TRelatedSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+
+        class Meta:
+            type_ = 'test-related-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+    class TResourceRel(BaseRelationshipResource):
+        parent_resource = TResource
+        relationship_name = 'rel'
+        max_body_size = 100
+
+        async def patch(self, parent_id: str, *args, **kwargs) -> Response:
+            return Response(await self.deserialize_ids())
+
+    TResource.register_routes(app=app, base_path='/')
+    TResourceRel.register_routes(app=app)
+
+    test_client = TestClient(app)
+    rv = test_client.patch(
+        '/test-resource/foo/relationships/rel',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-related-resource', 'id': 'bar'}},
+    )
+    assert rv.status_code == 200
+    assert rv.text == 'bar'
+
+    rv = test_client.patch(
+        '/test-resource/foo/relationships/rel',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-related-resource', 'id': 'bar' * 100}},
+    )
+    assert rv.status_code == 413
+    assert rv.json() == {'errors': [{'detail': HTTPStatus(413).phrase}]}
+
+
 def test_method_not_allowed_relationship_resource(app: Starlette):
     class TResourceSchema(JSONAPISchema):
         class Meta:
@@ -495,6 +547,57 @@ def test_method_not_allowed_relationship_resource(app: Starlette):
     assert rv.status_code == 405
 
 
+def test_relationship_field_reuses_schema(app: Starlette):
+    instances = []
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+
+        rel = JSONAPIRelationship(
+            schema='TRelatedSchema',
+            type_='test-related-resource',
+            self_route='test-resource:relationships-rel',
+            self_route_kwargs={'parent_id': '<id>'},
+        )
+
+        class Meta:
+            type_ = 'test-resource'
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            instances.append(self)
+
+    class TRelatedSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+
+        class Meta:
+            type_ = 'test-related-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+    class TResourceRel(BaseRelationshipResource):
+        parent_resource = TResource
+        relationship_name = 'rel'
+
+        async def get(self, parent_id: str, *args, **kwargs) -> Response:
+            return await self.to_response(await self.serialize(dict(id=parent_id, rel=f'{parent_id}-rel')))
+
+    TResource.register_routes(app=app, base_path='/')
+    TResourceRel.register_routes(app=app)
+
+    test_client = TestClient(app)
+    for parent_id in ('foo', 'bar'):
+        rv = test_client.get(f'/test-resource/{parent_id}/relationships/rel')
+        assert rv.status_code == 200
+        assert rv.json() == {
+            'data': {'type': 'test-related-resource', 'id': f'{parent_id}-rel'},
+            'links': {'self': f'/test-resource/{parent_id}/relationships/rel'},
+        }
+    assert len(instances) == 1
+
+
 def test_relationship_resource_register_routes_missing_parent_type(app: Starlette):
     class TResourceSchema(JSONAPISchema):
         class Meta:
@@ -633,6 +736,34 @@ def test_get_related_resource(relationship_links_app: Starlette):
     }
 
 
+def test_get_related_resource_context_not_shared(relationship_links_app: Starlette):
+    from starlette_jsonapi import meta
+
+    contexts = []
+
+    async def get_related(self, id, relationship, *args, **kwargs):
+        contexts.append(dict(self.request_context))
+        self.request_context['foo'] = 'bar'
+        return await self.to_response(
+            await self.serialize_related(
+                dict(id='related-item-id', description='related-item-description'),
+            )
+        )
+
+    TResource = meta.registered_resources.get('TResource')
+    assert TResource is not None
+    setattr(TResource, 'get_related', get_related)
+
+    test_client = TestClient(relationship_links_app)
+    assert test_client.get('/test-resource/1/rel').status_code == 200
+    assert test_client.get('/test-resource/2/rel').status_code == 200
+    # the context registered with the route is copied for each request
+    assert contexts == [
+        {'relationship': 'rel', 'id': '1'},
+        {'relationship': 'rel', 'id': '2'},
+    ]
+
+
 def test_get_related_resource_many(relationship_links_app: Starlette):
     from starlette_jsonapi import meta
 
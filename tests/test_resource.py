@@ -1,18 +1,22 @@
+import asyncio
 import json
 import logging
 import uuid
 from asyncio import Future
-from typing import Any, List
+from http import HTTPStatus
+from typing import Any, List, Sequence
 from unittest import mock
 
+import orjson
 import pytest
 from marshmallow_jsonapi import fields
 from starlette.applications import Starlette
+from starlette.requests import Request
 from starlette.responses import Response
 from starlette.testclient import TestClient
 
 from starlette_jsonapi.fields import JSONAPIRelationship
-from starlette_jsonapi.resource import BaseResource
+from starlette_jsonapi.resource import BaseResource, _BaseResourceHandler
 from starlette_jsonapi.schema import JSONAPISchema
 
 
@@ -234,6 +238,144 @@ def test_deserialize(serialization_app: Starlette):
     }
 
 
+def test_deserialize_reuses_schema(app: Starlette):
+    instances = []
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str(required=True)
+
+        class Meta:
+            type_ = 'test-resource'
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            instances.append(self)
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+        async def post(self, *args, **kwargs) -> Response:
+            body = await self.deserialize_body()
+            return await self.to_response(await self.serialize(dict(id=1, name=body.get('name'))))
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    for name in ('foo', 'bar'):
+        rv = test_client.post(
+            '/test-resource/',
+            headers={'Content-Type': 'application/vnd.api+json'},
+            json={'data': {'type': 'test-resource', 'attributes': {'name': name}}},
+        )
+        assert rv.status_code == 200
+        assert rv.json()['data']['attributes'] == {'name': name}
+
+    rv = test_client.post(
+        '/test-resource/',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-resource', 'attributes': {}}},
+    )
+    assert rv.status_code == 400
+
+    # one instance validates and loads all request bodies, the others are used for serialization
+    assert len(instances) == 3
+
+
+@pytest.mark.parametrize('parse_body_with_orjson, json_parser', [(False, orjson), (True, orjson), (True, None)])
+def test_deserialize_json_parser(serialization_app: Starlette, parse_body_with_orjson, json_parser):
+    test_client = TestClient(app=serialization_app)
+    with mock.patch.object(BaseResource, 'parse_body_with_orjson', parse_body_with_orjson), \
+            mock.patch('starlette_jsonapi.resource.orjson', json_parser):
+        rv = test_client.post(
+            '/test-resource/',
+            headers={'Content-Type': 'application/vnd.api+json'},
+            json={'data': {'type': 'test-resource', 'attributes': {'name': 'ț'}}},
+        )
+        assert rv.status_code == 200
+        assert rv.json()['data']['attributes'] == {'name': 'ț'}
+
+        rv = test_client.post(
+            '/test-resource/',
+            headers={'Content-Type': 'application/vnd.api+json'},
+            content=b'{"data": ',
+        )
+        assert rv.status_code == 400
+        assert rv.json() == {'errors': [{'detail': 'Could not read request body as JSON.'}]}
+
+
+@pytest.mark.parametrize('parse_body_with_orjson, expected_count', [(False, 2 ** 64 + 1), (True, 2 ** 64)])
+def test_deserialize_large_integers(app: Starlette, parse_body_with_orjson, expected_count):
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        count = fields.Int()
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+        async def post(self, *args, **kwargs) -> Response:
+            body = await self.deserialize_body()
+            return await self.to_response(await self.serialize(dict(id=1, count=body['count'])))
+
+    setattr(TResource, 'parse_body_with_orjson', parse_body_with_orjson)
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    rv = test_client.post(
+        '/test-resource/',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        content=b'{"data": {"type": "test-resource", "attributes": {"count": 18446744073709551617}}}',
+    )
+    assert rv.status_code == 200
+    # orjson parses integers wider than 64 bits as floats, the standard library keeps them exact
+    assert rv.json()['data']['attributes'] == {'count': expected_count}
+
+
+def test_deserialize_max_body_size(app: Starlette):
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str()
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+        max_body_size = 100
+
+        async def post(self, *args, **kwargs) -> Response:
+            body = await self.deserialize_body()
+            # the body can be read again after being deserialized
+            raw_body = await self.request.json()
+            assert raw_body['data']['attributes'] == body
+            return await self.to_response(await self.serialize(dict(id=1, name=body.get('name'))))
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    rv = test_client.post(
+        '/test-resource/',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-resource', 'attributes': {'name': 'foo'}}},
+    )
+    assert rv.status_code == 200
+    assert rv.json()['data']['attributes'] == {'name': 'foo'}
+
+    rv = test_client.post(
+        '/test-resource/',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-resource', 'attributes': {'name': 'foo' * 100}}},
+    )
+    assert rv.status_code == 413
+    assert rv.json() == {'errors': [{'detail': HTTPStatus(413).phrase}]}
+
+
 def test_deserialize_raises_validation_errors(serialization_app: Starlette):
     test_client = TestClient(app=serialization_app)
     rv = test_client.post(
@@ -276,6 +418,59 @@ def test_deserialize_raises_validation_errors(serialization_app: Starlette):
     }
 
 
+def test_validate_body(app: Starlette):
+    validated_bodies = []
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str(required=True)
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+        async def validate_body(self, partial=None) -> dict:
+            body = await super().validate_body(partial=partial)
+            validated_bodies.append(body)
+            return body
+
+        async def post(self, *args, **kwargs) -> Response:
+            body = await self.deserialize_body()
+            return await self.to_response(await self.serialize(dict(id=1, name=body.get('name'))))
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    # overriding validate_body keeps calling it before loading the body
+    body = {'data': {'type': 'test-resource', 'attributes': {'name': 'foo'}}}
+    rv = test_client.post('/test-resource/', headers={'Content-Type': 'application/vnd.api+json'}, json=body)
+    assert rv.status_code == 200
+    assert rv.json()['data']['attributes'] == {'name': 'foo'}
+    assert validated_bodies == [body]
+
+    rv = test_client.post(
+        '/test-resource/',
+        headers={'Content-Type': 'application/vnd.api+json'},
+        json={'data': {'type': 'test-resource', 'attributes': {}}},
+    )
+    assert rv.status_code == 400
+    assert rv.json() == {
+        'errors': [
+            {
+                'detail': 'Missing data for required field.',
+                'source': {'pointer': '/data/attributes/name'},
+            },
+            {
+                'detail': 'Bad Request',
+            },
+        ]
+    }
+    assert len(validated_bodies) == 1
+
+
 @pytest.fixture()
 def included_app(app: Starlette):
     class TSchema(JSONAPISchema):
@@ -426,6 +621,105 @@ def test_included_data_many(included_app: Starlette):
     }
 
 
+@pytest.mark.parametrize('parallel, expected_peak', [(True, 2), (False, 1)])
+def test_included_data_many_parallel(app: Starlette, parallel: bool, expected_peak: int):
+    running = []
+    max_running = []
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str()
+
+        rel = JSONAPIRelationship(
+            schema='TRelatedSchema',
+            type_='test-related-resource',
+        )
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TRelatedSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        description = fields.Str()
+
+        class Meta:
+            type_ = 'test-related-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+        parallel_include = parallel
+
+        async def include_relations(self, obj: Any, relations: List[str]) -> None:
+            running.append(obj)
+            await asyncio.sleep(0)
+            max_running.append(len(running))
+            running.remove(obj)
+            obj['rel'] = dict(id=f'{obj["id"]}-rel', description='rel-description')
+
+        async def get_many(self, *args, **kwargs) -> Response:
+            return await self.to_response(await self.serialize(
+                [dict(id='foo', name='foo-name'), dict(id='foo2', name='foo2-name')],
+                many=True,
+            ))
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    rv = test_client.get('/test-resource/?include=rel')
+    assert rv.status_code == 200
+    assert [item['id'] for item in rv.json()['included']] == ['foo-rel', 'foo2-rel']
+    # with parallel_include, both items were being included at the same time
+    assert max(max_running) == expected_peak
+
+
+def test_included_data_many_batched(app: Starlette):
+    batches = []
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str()
+
+        rel = JSONAPIRelationship(
+            schema='TRelatedSchema',
+            type_='test-related-resource',
+        )
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TRelatedSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        description = fields.Str()
+
+        class Meta:
+            type_ = 'test-related-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+        async def include_relations_many(self, objs: Sequence, relations: List[str]) -> None:
+            batches.append([obj['id'] for obj in objs])
+            for obj in objs:
+                obj['rel'] = dict(id=f'{obj["id"]}-rel', description='rel-description')
+
+        async def get_many(self, *args, **kwargs) -> Response:
+            return await self.to_response(await self.serialize(
+                [dict(id='foo', name='foo-name'), dict(id='foo2', name='foo2-name')],
+                many=True,
+            ))
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    rv = test_client.get('/test-resource/?include=rel')
+    assert rv.status_code == 200
+    assert [item['id'] for item in rv.json()['included']] == ['foo-rel', 'foo2-rel']
+    # all items were included with a single call
+    assert batches == [['foo', 'foo2']]
+
+
 def test_no_included_data(included_app: Starlette):
     # if resource does not override `include_relations`,
     # a 400 error should be returned.
@@ -570,6 +864,40 @@ def test_sparse_fields(included_app: Starlette):
     }
 
 
+def test_sparse_fields_parsed_once_per_request(app: Starlette, monkeypatch):
+    from starlette_jsonapi import resource
+
+    parse_sparse_fields_params = mock.MagicMock(wraps=resource.parse_sparse_fields_params)
+    monkeypatch.setattr(resource, 'parse_sparse_fields_params', parse_sparse_fields_params)
+
+    class TSchema(JSONAPISchema):
+        id = fields.Str(dump_only=True)
+        name = fields.Str()
+        description = fields.Str()
+
+        class Meta:
+            type_ = 'test-resource'
+
+    class TResource(BaseResource):
+        type_ = 'test-resource'
+        schema = TSchema
+
+        async def get(self, id=None, *args, **kwargs) -> Response:
+            obj = dict(id=id, name='foo', description='bar')
+            first = await self.serialize(obj)
+            second = await self.serialize(obj)
+            assert first == second
+            return await self.to_response(second)
+
+    TResource.register_routes(app, '/')
+
+    test_client = TestClient(app=app)
+    rv = test_client.get('/test-resource/1?fields[test-resource]=name')
+    assert rv.status_code == 200
+    assert rv.json()['data']['attributes'] == {'name': 'foo'}
+    assert parse_sparse_fields_params.call_count == 1
+
+
 def test_sparse_fields_field_does_not_exist(included_app: Starlette):
     test_client = TestClient(included_app)
     rv = test_client.get(
@@ -885,6 +1213,65 @@ def test_top_level_meta(app: Starlette):
     }
 
 
+@pytest.mark.asyncio
+async def test_default_hooks():
+    fake_request = mock.MagicMock()
+    fake_request.method = 'GET'
+    fake_request.path_params = {'id': '123'}
+    calls = []
+
+    async def before_request(cls, request: Request, request_context: dict) -> None:
+        calls.append(('before_request', cls))
+
+    async def after_request(cls, request: Request, request_context: dict, response: Response) -> None:
+        calls.append(('after_request', cls))
+
+    class TResource(BaseResource):
+        async def get(self, id=None, *args, **kwargs) -> Response:
+            return Response(status_code=200)
+
+    class TOverridingResource(TResource):
+        @classmethod
+        async def before_request(cls, request: Request, request_context: dict) -> None:
+            calls.append(('overridden before_request', cls))
+
+        @classmethod
+        async def after_request(cls, request: Request, request_context: dict, response: Response) -> None:
+            calls.append(('overridden after_request', cls))
+
+    hooks = (
+        mock.patch.object(_BaseResourceHandler, 'before_request', classmethod(before_request)),
+        mock.patch.object(_BaseResourceHandler, 'after_request', classmethod(after_request)),
+    )
+
+    # the hooks are recorded as the defaults, so handle_request does not await them
+    with hooks[0], hooks[1], \
+            mock.patch('starlette_jsonapi.resource._default_before_request', before_request), \
+            mock.patch('starlette_jsonapi.resource._default_after_request', after_request):
+        resp = await TResource.handle_request('get', fake_request, extract_params=['id'])
+        assert resp.status_code == 200
+        assert calls == []
+
+        # hooks overridden by subclasses are still awaited
+        resp = await TOverridingResource.handle_request('get', fake_request, extract_params=['id'])
+        assert resp.status_code == 200
+        assert calls == [
+            ('overridden before_request', TOverridingResource),
+            ('overridden after_request', TOverridingResource),
+        ]
+
+    # the same hooks are awaited when they are not the defaults
+    calls.clear()
+    with hooks[0], hooks[1]:
+        resp = await TResource.handle_request('get', fake_request, extract_params=['id'])
+        assert resp.status_code == 200
+        assert calls == [('before_request', TResource), ('after_request', TResource)]
+
+    # the default hooks do nothing
+    await BaseResource.before_request(request=fake_request, request_context={})
+    await BaseResource.after_request(request=fake_request, request_context={}, response=Response())
+
+
 @pytest.mark.asyncio
 async def test_before_request_called(monkeypatch):
     f = Future()  # type: Future
@@ -1,3 +1,7 @@
+import math
+from unittest import mock
+
+from starlette_jsonapi import responses
 from starlette_jsonapi.responses import JSONAPIResponse
 
 
@@ -6,3 +10,24 @@ def test_jsonapi_response_headers():
     assert resp.status_code == 200
     assert resp.headers['content-type'] == 'application/vnd.api+json'
     assert resp.body == b''
+
+
+def test_jsonapi_response_render():
+    resp = JSONAPIResponse(content={'data': {'id': '1', 'type': 'test', 'attributes': {'name': 'ț'}}, 'meta': {1: 2}})
+    assert resp.body == '{"data":{"id":"1","type":"test","attributes":{"name":"ț"}},"meta":{"1":2}}'.encode('utf-8')
+
+    # falls back to the standard library json for values orjson cannot encode
+    resp = JSONAPIResponse(content={'meta': {'count': 2 ** 64}})
+    assert resp.body == b'{"meta":{"count":18446744073709551616}}'
+
+
+def test_jsonapi_response_render_nan():
+    # orjson renders non-finite floats as null
+    resp = JSONAPIResponse(content={'meta': {'value': math.nan}})
+    assert resp.body == b'{"meta":{"value":null}}'
+
+
+def test_jsonapi_response_render_without_orjson():
+    with mock.patch.object(responses, 'orjson', None):
+        resp = JSONAPIResponse(content={'data': None, 'meta': {1: 2}})
+        assert resp.body == b'{"data":null,"meta":{"1":2}}'
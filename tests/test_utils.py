@@ -288,6 +288,10 @@ def test_process_sparse_fields_without_fields():
 
     assert process_sparse_fields(complete_jsonapi_repr, many=False) == complete_jsonapi_repr
     assert process_sparse_fields(complete_jsonapi_repr, many=False, sparse_fields={}) == complete_jsonapi_repr
+    # the document is not copied if no requested type is found
+    assert process_sparse_fields(
+        complete_jsonapi_repr, many=False, sparse_fields={'articles': ['title']},
+    ) is complete_jsonapi_repr
 
 
 def test_safe_merge():